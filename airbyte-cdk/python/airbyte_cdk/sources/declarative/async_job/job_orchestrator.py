@@ -2,7 +2,9 @@
 
 import logging
 import time
-from typing import Any, Generator, Iterable, List, Mapping, Optional, Set
+from array import array
+from collections import deque
+from typing import Any, Deque, Dict, Generator, Iterable, List, Mapping, Optional, Set
 
 from airbyte_cdk import StreamSlice
 from airbyte_cdk.logger import lazy_log
@@ -23,22 +25,48 @@ class AsyncPartition:
     _MAX_NUMBER_OF_ATTEMPTS = 3
 
     def __init__(self, jobs: List[AsyncJob], stream_slice: StreamSlice) -> None:
-        self._attempts_per_job = {job: 0 for job in jobs}
+        # `_jobs` and `_attempts` are parallel: `_attempts[i]` is the attempt count of `_jobs[i]`
+        self._jobs: List[AsyncJob] = list(dict.fromkeys(jobs))
+        self._attempts = array("B", [0] * len(self._jobs))
+        self._index_by_job: Dict[AsyncJob, int] = {job: index for index, job in enumerate(self._jobs)}
         self._stream_slice = stream_slice
 
     def has_reached_max_attempt(self) -> bool:
-        return any(map(lambda attempt_count: attempt_count >= self._MAX_NUMBER_OF_ATTEMPTS, self._attempts_per_job.values()))
+        return max(self._attempts, default=0) >= self._MAX_NUMBER_OF_ATTEMPTS
 
     def replace_job(self, job_to_replace: AsyncJob, new_jobs: List[AsyncJob]) -> None:
-        current_attempt_count = self._attempts_per_job.pop(job_to_replace, None)
-        if current_attempt_count is None:
+        index = self._index_by_job.get(job_to_replace)
+        if index is None:
             raise ValueError("Could not find job to replace")
-        elif current_attempt_count >= self._MAX_NUMBER_OF_ATTEMPTS:
+        current_attempt_count = self._attempts[index]
+        if current_attempt_count >= self._MAX_NUMBER_OF_ATTEMPTS:
             raise ValueError(f"Max attempt reached for job in partition {self._stream_slice}")
 
+        self._remove_job(index)
         new_attempt_count = current_attempt_count + 1
         for job in new_jobs:
-            self._attempts_per_job[job] = new_attempt_count
+            existing_index = self._index_by_job.get(job)
+            if existing_index is None:
+                self._index_by_job[job] = len(self._jobs)
+                self._jobs.append(job)
+                self._attempts.append(new_attempt_count)
+            else:
+                self._attempts[existing_index] = new_attempt_count
+
+    def _remove_job(self, index: int) -> None:
+        """
+        Swap the job at `index` with the last one so that removing it does not shift the other jobs.
+        """
+        job = self._jobs[index]
+        last_index = len(self._jobs) - 1
+        if index != last_index:
+            last_job = self._jobs[last_index]
+            self._jobs[index] = last_job
+            self._attempts[index] = self._attempts[last_index]
+            self._index_by_job[last_job] = index
+        self._jobs.pop()
+        self._attempts.pop()
+        del self._index_by_job[job]
 
     def should_split(self, job: AsyncJob) -> bool:
         """
@@ -48,7 +76,7 @@ class AsyncPartition:
 
     @property
     def jobs(self) -> Iterable[AsyncJob]:
-        return self._attempts_per_job.keys()
+        return self._jobs
 
     @property
     def stream_slice(self) -> StreamSlice:
@@ -59,22 +87,42 @@ class AsyncPartition:
         """
         Given different job statuses, the priority is: FAILED, TIMED_OUT, RUNNING. Else, it means everything is completed.
         """
-        statuses = set(map(lambda job: job.status(), self.jobs))
-        if statuses == {AsyncJobStatus.COMPLETED}:
-            return AsyncJobStatus.COMPLETED
-        elif AsyncJobStatus.FAILED in statuses:
-            return AsyncJobStatus.FAILED
-        elif AsyncJobStatus.TIMED_OUT in statuses:
+        return self._reduce_statuses(job.status() for job in self.jobs)
+
+    def status_from_snapshot(self, status_snapshot: Mapping[AsyncJob, AsyncJobStatus]) -> AsyncJobStatus:
+        """
+        Same as `status` but relies on job statuses already collected for the current poll instead of calling `AsyncJob.status` again.
+        """
+        return self._reduce_statuses(status_snapshot[job] for job in self.jobs)
+
+    @staticmethod
+    def _reduce_statuses(statuses: Iterable[AsyncJobStatus]) -> AsyncJobStatus:
+        """
+        Statuses are consumed lazily so that we can stop as soon as a FAILED job is found as it has the highest priority.
+        """
+        has_job = has_timed_out = has_running = False
+        for status in statuses:
+            has_job = True
+            if status == AsyncJobStatus.FAILED:
+                return AsyncJobStatus.FAILED
+            elif status == AsyncJobStatus.TIMED_OUT:
+                has_timed_out = True
+            elif status != AsyncJobStatus.COMPLETED:
+                has_running = True
+
+        if has_timed_out:
             return AsyncJobStatus.TIMED_OUT
-        else:
+        elif has_running or not has_job:
             return AsyncJobStatus.RUNNING
+        return AsyncJobStatus.COMPLETED
 
     def __repr__(self) -> str:
-        return f"AsyncPartition(stream_slice={self._stream_slice}, attempt_per_job={self._attempts_per_job})"
+        return f"AsyncPartition(stream_slice={self._stream_slice}, attempt_per_job={dict(zip(self._jobs, self._attempts))})"
 
 
 class AsyncJobOrchestrator:
     _WAIT_TIME_BETWEEN_STATUS_UPDATE_IN_SECONDS = 5
+    _FAILED_STATUSES = frozenset({AsyncJobStatus.FAILED, AsyncJobStatus.TIMED_OUT})
 
     def __init__(
         self,
@@ -85,12 +133,19 @@ class AsyncJobOrchestrator:
         self._job_repository: AsyncJobRepository = job_repository
         self._slice_iterator = iter(slices)
         self._running_partitions: List[AsyncPartition] = []
+        self._running_jobs: Set[AsyncJob] = set()
+
+    def _start_job(self, _slice: StreamSlice) -> AsyncJob:
+        job = self._job_repository.start(_slice)
+        self._running_jobs.add(job)
+        return job
 
     def _replace_failed_jobs(self, partition: AsyncPartition) -> None:
-        failed_status_jobs = (AsyncJobStatus.FAILED, AsyncJobStatus.TIMED_OUT)
-        jobs_to_replace = [job for job in partition.jobs if job.status() in failed_status_jobs]
+        # the status is not taken from the last snapshot as jobs can time out while we wait between two polls
+        # `partition.jobs` is modified by `replace_job` so we iterate over an immutable snapshot of the jobs to replace
+        jobs_to_replace = tuple(job for job in partition.jobs if job.status() in self._FAILED_STATUSES)
         for job in jobs_to_replace:
-            new_job = self._job_repository.start(job.job_parameters())
+            new_job = self._start_job(job.job_parameters())
             partition.replace_job(job, [new_job])
 
     def _start_jobs(self) -> None:
@@ -108,26 +163,31 @@ class AsyncJobOrchestrator:
             self._replace_failed_jobs(partition)
 
         for _slice in self._slice_iterator:
-            job = self._job_repository.start(_slice)
+            job = self._start_job(_slice)
             self._running_partitions.append(AsyncPartition([job], _slice))
 
-    def _get_running_jobs(self) -> Set[AsyncJob]:
+    def _update_jobs_status(self) -> None:
         """
-        Returns a set of running AsyncJob objects.
+        Update the status of all running jobs in the repository.
 
-        Returns:
-            Set[AsyncJob]: A set of AsyncJob objects that are currently running.
+        Only the jobs started by this orchestrator that were still running at the previous poll are considered which avoids scanning
+        every job of every partition.
         """
-        return {job for partition in self._running_partitions for job in partition.jobs if job.status() == AsyncJobStatus.RUNNING}
+        # jobs can time out while we wait between two polls
+        self._running_jobs.difference_update([job for job in self._running_jobs if job.status() != AsyncJobStatus.RUNNING])
+        if self._running_jobs:
+            # update the status only if there are RUNNING jobs
+            self._job_repository.update_jobs_status(set(self._running_jobs))
 
-    def _update_jobs_status(self) -> None:
+    def _take_status_snapshot(self) -> Mapping[AsyncJob, AsyncJobStatus]:
         """
-        Update the status of all running jobs in the repository.
+        Collect the status of every job in the running partitions once so that the rest of the poll cycle does not have to call
+        `AsyncJob.status` again.
+
+        Returns:
+            Mapping[AsyncJob, AsyncJobStatus]: The status per job.
         """
-        running_jobs = self._get_running_jobs()
-        if running_jobs:
-            # update the status only if there are RUNNING jobs
-            self._job_repository.update_jobs_status(running_jobs)
+        return {job: job.status() for partition in self._running_partitions for job in partition.jobs}
 
     def _wait_on_status_update(self) -> None:
         """
@@ -161,47 +221,58 @@ class AsyncJobOrchestrator:
         Args:
             partition (AsyncPartition): The completed partition to process.
         """
-        job_ids = list(map(lambda job: job.api_job_id(), {job for job in partition.jobs}))
-        LOGGER.info(f"The following jobs for stream slice {partition.stream_slice} have been completed: {job_ids}.")
+        lazy_log(
+            LOGGER,
+            logging.INFO,
+            lambda: f"The following jobs for stream slice {partition.stream_slice} have been completed: "
+            f"{[job.api_job_id() for job in partition.jobs]}.",
+        )
 
-    def _process_running_partitions_and_yield_completed_ones(self) -> Generator[AsyncPartition, Any, None]:
+    def _process_running_partitions_and_yield_completed_ones(
+        self, status_snapshot: Mapping[AsyncJob, AsyncJobStatus]
+    ) -> Generator[AsyncPartition, Any, None]:
         """
         Process the running partitions.
 
+        Args:
+            status_snapshot (Mapping[AsyncJob, AsyncJobStatus]): The job statuses collected after the last status update.
+
         Yields:
             AsyncPartition: The processed partition.
 
         Raises:
             Any: Any exception raised during processing.
         """
-        current_running_partitions: List[AsyncPartition] = []
+        current_running_partitions: Deque[AsyncPartition] = deque()
         for partition in self._running_partitions:
-            match partition.status:
-                case AsyncJobStatus.COMPLETED:
-                    self._process_completed_partition(partition)
-                    yield partition
-                case AsyncJobStatus.RUNNING:
-                    current_running_partitions.append(partition)
-                case _ if partition.has_reached_max_attempt():
-                    self._process_partitions_with_errors(partition)
-                case _:
-                    # job will be restarted in `_start_job`
-                    current_running_partitions.insert(0, partition)
+            status = partition.status_from_snapshot(status_snapshot)
+            # RUNNING is checked first as it is the most common status while polling
+            if status is AsyncJobStatus.RUNNING:
+                current_running_partitions.append(partition)
+            elif status is AsyncJobStatus.COMPLETED:
+                self._process_completed_partition(partition)
+                yield partition
+            elif partition.has_reached_max_attempt():
+                self._process_partitions_with_errors(partition, status_snapshot)
+            else:
+                # job will be restarted in `_start_job`
+                current_running_partitions.appendleft(partition)
         # update the referenced list with running partitions
-        self._running_partitions = current_running_partitions
+        self._running_partitions = list(current_running_partitions)
 
-    def _process_partitions_with_errors(self, partition: AsyncPartition) -> None:
+    def _process_partitions_with_errors(self, partition: AsyncPartition, status_snapshot: Mapping[AsyncJob, AsyncJobStatus]) -> None:
         """
         Process a partition with status errors (FAILED and TIMEOUT).
 
         Args:
             partition (AsyncPartition): The partition to process.
+            status_snapshot (Mapping[AsyncJob, AsyncJobStatus]): The job statuses collected after the last status update.
         Returns:
             AirbyteTracedException: An exception indicating that at least one job could not be completed.
         Raises:
             AirbyteTracedException: If at least one job could not be completed.
         """
-        status_by_job_id = {job.api_job_id(): job.status() for job in partition.jobs}
+        status_by_job_id = {job.api_job_id(): status_snapshot[job] for job in partition.jobs}
         raise AirbyteTracedException(
             message=f"At least one job could not be completed. Job statuses were: {status_by_job_id}",
             failure_type=FailureType.system_error,
@@ -224,7 +295,8 @@ class AsyncJobOrchestrator:
                 break
 
             self._update_jobs_status()
-            yield from self._process_running_partitions_and_yield_completed_ones()
+            status_snapshot = self._take_status_snapshot()
+            yield from self._process_running_partitions_and_yield_completed_ones(status_snapshot)
             self._wait_on_status_update()
 
     def fetch_records(self, partition: AsyncPartition) -> Iterable[Mapping[str, Any]]:
@@ -1,8 +1,11 @@
 # Copyright (c) 2024 Airbyte, Inc., all rights reserved.
 
+from functools import lru_cache
+
 from pydantic import FilePath
 
 
+@lru_cache(maxsize=None)
 def get_unit_test_folder(execution_folder: str) -> FilePath:
     path = FilePath(execution_folder)
     while path.name != "unit_tests":
@@ -14,7 +17,10 @@ def get_unit_test_folder(execution_folder: str) -> FilePath:
 
 def read_resource_file_contents(resource: str, test_location: str) -> str:
     """Read the contents of a test data file from the test resource folder."""
-    file_path = str(get_unit_test_folder(test_location) / "resource" / "http" / "response" / f"{resource}")
-    with open(file_path) as f:
-        response = f.read()
-    return response
+    return _read_file_contents(get_unit_test_folder(test_location) / "resource" / "http" / "response" / resource)
+
+
+@lru_cache(maxsize=256)
+def _read_file_contents(file_path: FilePath) -> str:
+    """Test fixtures are usually read many times during a test session so we keep the most recent ones in memory."""
+    return file_path.read_text()
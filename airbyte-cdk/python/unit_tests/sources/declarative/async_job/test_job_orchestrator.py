@@ -41,6 +41,39 @@ class AsyncPartitionTest(TestCase):
         partition = AsyncPartition([_create_job(AsyncJobStatus.COMPLETED) for _ in range(10)], _ANY_STREAM_SLICE)
         assert partition.status == AsyncJobStatus.COMPLETED
 
+    def test_given_many_jobs_when_replace_job_then_keep_other_jobs_and_increase_attempt_of_new_job(self) -> None:
+        first_job, second_job, third_job, new_job = _create_job(), _create_job(), _create_job(), _create_job()
+        partition = AsyncPartition([first_job, second_job, third_job], _ANY_STREAM_SLICE)
+
+        partition.replace_job(first_job, [new_job])
+
+        assert set(partition.jobs) == {second_job, third_job, new_job}
+        assert not partition.has_reached_max_attempt()
+
+    def test_given_job_replaced_max_number_of_times_when_replace_job_then_raise(self) -> None:
+        job = _create_job()
+        partition = AsyncPartition([job], _ANY_STREAM_SLICE)
+        for _ in range(AsyncPartition._MAX_NUMBER_OF_ATTEMPTS):
+            partition.replace_job(job, [job])
+
+        assert partition.has_reached_max_attempt()
+        with pytest.raises(ValueError):
+            partition.replace_job(job, [job])
+
+    def test_given_failed_job_first_when_status_then_do_not_query_following_jobs(self) -> None:
+        following_job = _create_job(AsyncJobStatus.RUNNING)
+        partition = AsyncPartition([_create_job(AsyncJobStatus.FAILED), following_job], _ANY_STREAM_SLICE)
+
+        assert partition.status == AsyncJobStatus.FAILED
+        following_job.status.assert_not_called()
+
+    def test_given_status_snapshot_when_status_from_snapshot_then_do_not_query_job_status(self) -> None:
+        job = _create_job(AsyncJobStatus.RUNNING)
+        partition = AsyncPartition([job], _ANY_STREAM_SLICE)
+
+        assert partition.status_from_snapshot({job: AsyncJobStatus.COMPLETED}) == AsyncJobStatus.COMPLETED
+        job.status.assert_not_called()
+
 
 def _status_update_per_jobs(status_update_per_jobs: Mapping[AsyncJob, List[AsyncJobStatus]]) -> Callable[[set[AsyncJob]], None]:
     status_index_by_job = {job: 0 for job in status_update_per_jobs.keys()}
@@ -128,6 +161,27 @@ class AsyncJobOrchestratorTest(TestCase):
             list(orchestrator.create_and_get_completed_partitions())
         assert self._job_repository.start.call_args_list == [call(_A_STREAM_SLICE)] * 4
 
+    @mock.patch(sleep_mock_target)
+    def test_given_job_times_out_between_polls_when_create_and_get_completed_partitions_then_replace_job_on_next_poll(self, mock_sleep: MagicMock) -> None:
+        timing_out_job = _create_job(AsyncJobStatus.RUNNING)
+        timing_out_job.job_parameters.return_value = _A_STREAM_SLICE
+        mock_sleep.side_effect = lambda _: setattr(timing_out_job.status, "return_value", AsyncJobStatus.TIMED_OUT)
+        self._job_repository.start.side_effect = [timing_out_job, self._job_for_a_slice]
+        self._job_repository.update_jobs_status.side_effect = _status_update_per_jobs(
+            {
+                timing_out_job: [AsyncJobStatus.RUNNING],
+                self._job_for_a_slice: [AsyncJobStatus.COMPLETED],
+            }
+        )
+        orchestrator = self._orchestrator([_A_STREAM_SLICE])
+
+        partitions = list(orchestrator.create_and_get_completed_partitions())
+
+        assert list(partitions[0].jobs) == [self._job_for_a_slice]
+        assert self._job_repository.start.call_args_list == [call(_A_STREAM_SLICE)] * 2
+        assert self._job_repository.update_jobs_status.mock_calls == [call({timing_out_job}), call({self._job_for_a_slice})]
+        assert mock_sleep.call_count == 1
+
     def test_when_fetch_records_then_yield_records_from_each_job(self) -> None:
         self._job_repository.fetch_records.return_value = [_ANY_RECORD]
         orchestrator = self._orchestrator([_A_STREAM_SLICE])
@@ -294,12 +294,14 @@ class Metafield(ShopifyBulkQuery):
             return ["__typename", "id", metafield_node]
 
     def record_process_components(self, record: MutableMapping[str, Any]) -> Iterable[MutableMapping[str, Any]]:
+        # the `__parentId` is always formatted as: `gid://shopify/<Resource>/<Id>`
+        owner, _, owner_id = record[BULK_PARENT_KEY].rpartition("/")
         # resolve parent id from `str` to `int`
-        record["owner_id"] = self.tools.resolve_str_id(record.get(BULK_PARENT_KEY))
+        record["owner_id"] = int(owner_id)
         # add `owner_resource` field
-        record["owner_resource"] = self.tools.camel_to_snake(record.get(BULK_PARENT_KEY, "").split("/")[3])
+        record["owner_resource"] = self.tools.camel_to_snake(owner.rpartition("/")[2])
         # remove `__parentId` from record
-        record.pop(BULK_PARENT_KEY, None)
+        del record[BULK_PARENT_KEY]
         # convert dates from ISO-8601 to RFC-3339
         record["createdAt"] = self.tools.from_iso8601_to_rfc3339(record, "createdAt")
         record["updatedAt"] = self.tools.from_iso8601_to_rfc3339(record, "updatedAt")
@@ -1376,7 +1378,7 @@ class InventoryLevel(ShopifyBulkQuery):
         # add `location_id` from `__parentId`
         record["location_id"] = self.tools.resolve_str_id(record[BULK_PARENT_KEY])
         # make composite `id` from `location_id|inventory_item_id`
-        record["id"] = "|".join((str(record.get("location_id", "")), str(record.get("inventory_item_id", ""))))
+        record["id"] = f"{record.get('location_id', '')}|{record.get('inventory_item_id', '')}"
         # convert dates from ISO-8601 to RFC-3339
         record["updatedAt"] = self.tools.from_iso8601_to_rfc3339(record, "updatedAt")
         # remove leftovers
@@ -3,17 +3,23 @@
 #
 
 
+import json
 import logging
+import re
 from dataclasses import dataclass, field
-from io import TextIOWrapper
-from json import loads
+from io import BufferedReader
 from os import remove
 from typing import Any, Callable, Final, Iterable, List, Mapping, MutableMapping, Optional, Union
 
+import orjson
+
 from .exceptions import ShopifyBulkExceptions
 from .query import ShopifyBulkQuery
 from .tools import END_OF_FILE, BulkTools
 
+# `orjson` turns the integers out of the 64-bit range into `float`, which are at least 19 digits long
+LONG_NUMBER_PATTERN = re.compile(rb"\d{19,}")
+
 
 @dataclass
 class ShopifyBulkRecord:
@@ -87,14 +93,28 @@ class ShopifyBulkRecord:
         elif self.check_type(record, self.components):
             self.record_new_component(record)
 
-    def process_line(self, jsonl_file: TextIOWrapper) -> Iterable[MutableMapping[str, Any]]:
+    @staticmethod
+    def decode_line(line: bytes) -> MutableMapping[str, Any]:
+        """
+        Decode the json line with `orjson`, falling back to the standard `json` for the input `orjson` would not read as is:
+        the lines with very long numbers, or the ones `orjson` rejects, like the lone surrogates in the merchant-entered text.
+        """
+        if not LONG_NUMBER_PATTERN.search(line):
+            try:
+                return orjson.loads(line)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(line)
+
+    def process_line(self, jsonl_file: BufferedReader) -> Iterable[MutableMapping[str, Any]]:
+        end_of_file = END_OF_FILE.encode()
         # process the json lines
         for line in jsonl_file:
             # we exit from the loop when receive <end_of_file> (file ends)
-            if line == END_OF_FILE:
+            if line == end_of_file:
                 break
-            elif line != "":
-                yield from self.record_compose(loads(line))
+            elif line != b"":
+                yield from self.record_compose(self.decode_line(line))
 
         # emit what's left in the buffer, typically last record
         yield from self.buffer_flush()
@@ -128,7 +148,8 @@ class ShopifyBulkRecord:
             Note: typically the `filename` is taken from the `result_url` string provided in the response.
         """
 
-        with open(filename, "r") as jsonl_file:
+        # the lines are read as `bytes`, there is no need to decode them to `str` before parsing
+        with open(filename, "rb") as jsonl_file:
             # reset the counter
             self.record_composed = 0
 
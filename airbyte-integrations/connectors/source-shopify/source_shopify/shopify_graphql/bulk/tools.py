@@ -4,6 +4,7 @@
 
 
 import re
+from functools import lru_cache
 from typing import Any, Mapping, MutableMapping, Optional, Union
 from urllib.parse import parse_qsl, urlparse
 
@@ -14,10 +15,13 @@ from .exceptions import ShopifyBulkExceptions
 # default end line tag
 END_OF_FILE: str = "<end_of_file>"
 BULK_PARENT_KEY: str = "__parentId"
+# the ids are resolved for every record, so the pattern is compiled once
+DIGITS_PATTERN = re.compile(r"\d+")
 
 
 class BulkTools:
     @staticmethod
+    @lru_cache(maxsize=256)
     def camel_to_snake(camel_case: str) -> str:
         snake_case = []
         for char in camel_case:
@@ -88,6 +92,6 @@ class BulkTools:
         # some fields that expected to be resolved as ids, might not be populated for the particular `RECORD`,
         # we should return `None` to make the field `null` in the output as the result of the transformation.
         if str_input:
-            return output_type(re.search(r"\d+", str_input).group())
+            return output_type(DIGITS_PATTERN.search(str_input).group())
         else:
             return None
@@ -3,6 +3,8 @@
 #
 
 
+import json
+from functools import lru_cache
 from typing import Optional
 
 import sgqlc.operation
@@ -12,6 +14,10 @@ from . import schema
 _schema = schema
 _schema_root = _schema.shopify_schema
 
+# the placeholders for the arguments changing from page to page
+_QUERY_PLACEHOLDER = "$query"
+_AFTER_PLACEHOLDER = "$after"
+
 
 # the graphql api requires the query filter to be snake case even though the column returned is camel case
 def _camel_to_snake(camel_case: str):
@@ -25,12 +31,24 @@ def _camel_to_snake(camel_case: str):
 
 
 def get_query_products(first: int, filter_field: str, filter_value: str, next_page_token: Optional[str]):
-    op = sgqlc.operation.Operation(_schema_root.query_type)
     snake_case_filter_field = _camel_to_snake(filter_field)
+    query = f"{snake_case_filter_field}:>'{filter_value}'" if filter_value else None
+    # `sgqlc` renders the string arguments as json values, `None` becomes `null`
+    return (
+        _get_query_products_template(first)
+        .replace(json.dumps(_AFTER_PLACEHOLDER), json.dumps(next_page_token), 1)
+        .replace(json.dumps(_QUERY_PLACEHOLDER), json.dumps(query), 1)
+    )
+
+
+@lru_cache(maxsize=16)
+def _get_query_products_template(first: int) -> str:
+    # the query is requested for every page, but only the `query` and `after` arguments are changing between them
+    op = sgqlc.operation.Operation(_schema_root.query_type)
     products_args = {
         "first": first,
-        "query": f"{snake_case_filter_field}:>'{filter_value}'" if filter_value else None,
-        "after": next_page_token,
+        "query": _QUERY_PLACEHOLDER,
+        "after": _AFTER_PLACEHOLDER,
     }
     products = op.products(**products_args)
     products.nodes.id()
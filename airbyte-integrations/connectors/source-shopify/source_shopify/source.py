@@ -6,6 +6,7 @@
 import logging
 from typing import Any, List, Mapping, Tuple
 
+import requests
 from airbyte_cdk.models import FailureType, SyncMode
 from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.streams import Stream
@@ -170,6 +171,8 @@ class SourceShopify(AbstractSource):
         """
         config["shop"] = self.get_shop_name(config)
         config["authenticator"] = ShopifyAuthenticator(config)
+        # one session per source, shared by all the streams
+        config["session"] = requests.Session()
         # add `shop_id` int value
         config["shop_id"] = ConnectionCheckTest(config).get_shop_id()
         # define scopes checker
@@ -13,6 +13,7 @@ from urllib.parse import parse_qsl, urlparse
 import pendulum as pdm
 import requests
 from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.message import InMemoryMessageRepository
 from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.sources.streams.http import HttpClient, HttpStream
 from airbyte_cdk.sources.streams.http.error_handlers import ErrorHandler, HttpStatusErrorHandler
@@ -44,6 +45,18 @@ class ShopifyStream(HttpStream, ABC):
         super().__init__(authenticator=config["authenticator"])
         self._transformer = DataTypeEnforcer(self.get_json_schema())
         self.config = config
+        # the streams of the source are talking to the same shop, so they reuse the connections of the source `session`,
+        # the cached streams keep their own session bound to the stream cache file
+        if config.get("session") and not self.use_cache:
+            self._http_client = HttpClient(
+                name=self.name,
+                logger=self.logger,
+                error_handler=self.get_error_handler(),
+                session=config["session"],
+                authenticator=config["authenticator"],
+                backoff_strategy=self.get_backoff_strategy(),
+                message_repository=InMemoryMessageRepository(),
+            )
 
     @property
     @abstractmethod
@@ -590,7 +603,7 @@ class IncrementalShopifyStreamWithDeletedEvents(IncrementalShopifyStream):
 
         """
 
-    @property
+    @cached_property
     def deleted_events(self) -> ShopifyDeletedEventsStream:
         """
         The Events stream instance to fetch the `destroyed` records for specified `deleted_events_api_name`, like: `Product`.
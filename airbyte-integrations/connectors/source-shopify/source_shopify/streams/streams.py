@@ -33,7 +33,7 @@ from source_shopify.shopify_graphql.bulk.query import (
     Transaction,
 )
 from source_shopify.shopify_graphql.graphql import get_query_products
-from source_shopify.utils import ApiTypeEnum
+from source_shopify.utils import ApiTypeEnum, get_response_json
 from source_shopify.utils import ShopifyRateLimiter as limiter
 
 from .base_streams import (
@@ -152,7 +152,7 @@ class ProductsGraphQl(IncrementalShopifyStream):
 
     @staticmethod
     def next_page_token(response: requests.Response) -> Optional[Mapping[str, Any]]:
-        page_info = response.json()["data"]["products"]["pageInfo"]
+        page_info = get_response_json(response)["data"]["products"]["pageInfo"]
         has_next_page = page_info["hasNextPage"]
         if has_next_page:
             return page_info["endCursor"]
@@ -163,7 +163,7 @@ class ProductsGraphQl(IncrementalShopifyStream):
     def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
         if response.status_code is requests.codes.OK:
             try:
-                json_response = response.json()["data"]["products"]["nodes"]
+                json_response = get_response_json(response)["data"]["products"]["nodes"]
                 yield from self.produce_records(json_response)
             except RequestException as e:
                 self.logger.warning(f"Unexpected error in `parse_ersponse`: {e}, the actual response data: {response.text}")
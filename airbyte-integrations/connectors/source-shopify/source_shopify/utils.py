@@ -9,6 +9,7 @@ from functools import wraps
 from time import sleep
 from typing import Any, Callable, Dict, List, Mapping, Optional
 
+import orjson
 import requests
 from airbyte_cdk.models import FailureType
 from airbyte_cdk.sources.streams.http.error_handlers.response_models import ErrorResolution, ResponseAction
@@ -96,6 +97,21 @@ class ApiTypeEnum(enum.Enum):
         return [api_type.value for api_type in ApiTypeEnum]
 
 
+def get_response_json(response: requests.Response) -> Any:
+    """
+    Decodes the json body of the `response` only once.
+    The same GraphQL page is read by the rate limiter, `parse_response` and `next_page_token`,
+    so the decoded body is kept on the `response` itself and is released together with it.
+    """
+    if not hasattr(response, "_decoded_json"):
+        try:
+            response._decoded_json = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # `orjson` is stricter than `json`, e.g. it rejects the lone surrogates in the merchant-entered text
+            response._decoded_json = response.json()
+    return response._decoded_json
+
+
 class ShopifyRateLimiter:
     """
     Define timings for RateLimits. Adjust timings if needed.
@@ -148,7 +164,7 @@ class ShopifyRateLimiter:
         half_of_threshold = threshold / 2  # average load based on threshold
         quarter_of_threshold = threshold / 4  # low load based on threshold
 
-        if not load:
+        if load is None:
             # when there is no rate_limits from header, use the `sleep_on_unknown_load`
             wait_time = ShopifyRateLimiter.on_unknown_load
             ShopifyRateLimiter.log_message_counter("API Load: `REGULAR`")
@@ -234,11 +250,11 @@ class ShopifyRateLimiter:
         # Get the rate limit info from response
         if response:
             try:
-                throttle_status = response.json()["extensions"]["cost"]["throttleStatus"]
+                throttle_status = get_response_json(response)["extensions"]["cost"]["throttleStatus"]
                 max_available = throttle_status["maximumAvailable"]
                 currently_available = throttle_status["currentlyAvailable"]
-                if max_available and currently_available:
-                    load = (int(max_available) - int(currently_available)) / int(max_available)
+                # the fully restored bucket (load = 0) and the drained one (load = 1) are both valid loads
+                load = (int(max_available) - int(currently_available)) / int(max_available) if max_available else None
             except KeyError:
                 load = None
         else:
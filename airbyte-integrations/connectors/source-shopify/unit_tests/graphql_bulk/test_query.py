@@ -300,4 +300,19 @@ def test_base_build_query(basic_config, query_name, fields, filter_field, start,
 )
 def test_bulk_query(basic_config, query_class, filter_field, start, end, expected) -> None:
     stream = query_class(basic_config)
-    assert stream.get(filter_field, start, end) == expected.render()
\ No newline at end of file
+    assert stream.get(filter_field, start, end) == expected.render()
+
+
+def test_metafield_record_process_components(basic_config) -> None:
+    record = {
+        "__typename": "Metafield",
+        "id": "gid://shopify/Metafield/22347288150205",
+        "createdAt": "2023-01-01T15:00:00Z",
+        "updatedAt": "2023-01-01T15:00:00Z",
+        "__parentId": "gid://shopify/ProductImage/30890345971901",
+    }
+    result = next(MetafieldProductImage(basic_config).record_process_components(record))
+    assert result["owner_id"] == 30890345971901
+    assert result["owner_resource"] == "product_image"
+    assert result["created_at"] == "2023-01-01T15:00:00+00:00"
+    assert "__parentId" not in result
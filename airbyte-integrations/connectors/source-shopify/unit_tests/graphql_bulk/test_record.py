@@ -2,7 +2,7 @@
 
 
 import pytest
-from source_shopify.shopify_graphql.bulk.query import ShopifyBulkQuery
+from source_shopify.shopify_graphql.bulk.query import MetafieldCustomer, ShopifyBulkQuery
 from source_shopify.shopify_graphql.bulk.record import ShopifyBulkRecord
 
 
@@ -207,3 +207,36 @@ def test_record_compose(basic_config, records_from_jsonl, record_composition, ex
         list(record_instance.record_compose(record))
 
     assert record_instance.buffer == expected
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        (b'{"id": "gid://shopify/Order/19435458986123"}\n', {"id": "gid://shopify/Order/19435458986123"}),
+        (b'{"note": "\\ud800"}\n', {"note": "\ud800"}),
+        (b'{"value": 123456789012345678901234567890}\n', {"value": 123456789012345678901234567890}),
+    ],
+    ids=["regular line", "lone surrogate", "integer out of 64-bit range"],
+)
+def test_decode_line(line, expected) -> None:
+    assert ShopifyBulkRecord.decode_line(line) == expected
+
+
+def test_produce_records(basic_config, tmp_path) -> None:
+    jsonl_file = tmp_path / "bulk-123.jsonl"
+    jsonl_file.write_bytes(
+        b'{"__typename": "Metafield", "id": "gid://shopify/Metafield/2", "value": "caf\xc3\xa9", "__parentId": "gid://shopify/Customer/1"}\n'
+        b"<end_of_file>"
+    )
+    records = list(ShopifyBulkRecord(MetafieldCustomer(basic_config)).produce_records(str(jsonl_file)))
+    assert records == [
+        {
+            "id": 2,
+            "value": "café",
+            "owner_id": 1,
+            "owner_resource": "customer",
+            "created_at": None,
+            "updated_at": None,
+            "admin_graphql_api_id": "gid://shopify/Metafield/2",
+        }
+    ]
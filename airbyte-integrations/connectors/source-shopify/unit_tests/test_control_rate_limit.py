@@ -58,6 +58,20 @@ def test_rest_api_with_very_low_load(requests_mock):
     assert limiter.on_very_low_load == actual_sleep_time
 
 
+def test_rest_api_with_no_load(requests_mock):
+    """
+    Test simulates no load 0/40 points of rate limit, the next request should not wait.
+    """
+    test_response_header = {"X-Shopify-Shop-Api-Call-Limit": "0/40"}
+
+    requests_mock.get("https://test.myshopify.com/", headers=test_response_header)
+    test_response = requests.get("https://test.myshopify.com/")
+
+    actual_sleep_time = limiter.get_rest_api_wait_time(test_response, threshold=TEST_THRESHOLD, rate_limit_header=TEST_RATE_LIMIT_HEADER)
+
+    assert limiter.on_very_low_load == actual_sleep_time
+
+
 def test_rest_api_with_low_load(requests_mock):
     """
     Test simulates low load 10/40 points of rate limit.
@@ -164,3 +178,29 @@ def test_graphql_api_with_high_load(requests_mock):
     actual_sleep_time = limiter.get_graphql_api_wait_time(test_response, threshold=TEST_THRESHOLD)
 
     assert limiter.on_high_load == actual_sleep_time
+
+
+def test_graphql_api_with_restored_bucket(requests_mock):
+    """
+    Test simulates no load (2000-2000)/2000=0 points of rate limit, the next request should not wait.
+    """
+    api_response = get_graphql_api_response(maximum_available=2000, currently_available=2000)
+    requests_mock.get("https://test.myshopify.com/", json=api_response)
+    test_response = requests.get("https://test.myshopify.com/")
+
+    actual_sleep_time = limiter.get_graphql_api_wait_time(test_response, threshold=TEST_THRESHOLD)
+
+    assert limiter.on_very_low_load == actual_sleep_time
+
+
+def test_graphql_api_with_drained_bucket(requests_mock):
+    """
+    Test simulates full load (2000-0)/2000=1 points of rate limit.
+    """
+    api_response = get_graphql_api_response(maximum_available=2000, currently_available=0)
+    requests_mock.get("https://test.myshopify.com/", json=api_response)
+    test_response = requests.get("https://test.myshopify.com/")
+
+    actual_sleep_time = limiter.get_graphql_api_wait_time(test_response, threshold=TEST_THRESHOLD)
+
+    assert limiter.on_high_load == actual_sleep_time
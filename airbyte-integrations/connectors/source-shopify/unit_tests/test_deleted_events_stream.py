@@ -193,6 +193,8 @@ def test_request_params(config, stream, stream_state, next_page_token, expected_
 def test_deleted_events_instance(stream, config, expected) -> None:
     stream = stream(config)
     assert isinstance(stream.deleted_events, expected)
+    # the events stream is built once per stream instance
+    assert stream.deleted_events is stream.deleted_events
 
 
 @pytest.mark.parametrize(
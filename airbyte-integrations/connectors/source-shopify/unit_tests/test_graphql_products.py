@@ -1,7 +1,14 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 
+import json
+
+import orjson
 import pytest
+import requests
 from source_shopify.shopify_graphql.graphql import get_query_products
+from source_shopify.streams.streams import ProductsGraphQl
+from source_shopify.utils import ShopifyRateLimiter as limiter
+from source_shopify.utils import get_response_json
 
 
 @pytest.mark.parametrize(
@@ -14,3 +21,38 @@ from source_shopify.shopify_graphql.graphql import get_query_products
 )
 def test_get_query_products(page_size, filter_value, next_page_token, expected_query):
     assert get_query_products(page_size, 'updatedAt', filter_value, next_page_token) == expected_query
+
+
+@pytest.mark.parametrize(
+    "page_info, expected",
+    [
+        ({"hasNextPage": True, "endCursor": "end_cursor_value"}, "end_cursor_value"),
+        ({"hasNextPage": False, "endCursor": None}, None),
+    ],
+)
+def test_products_next_page_token(page_info, expected):
+    response = requests.Response()
+    response._content = json.dumps({"data": {"products": {"nodes": [], "pageInfo": page_info}}}).encode()
+    assert ProductsGraphQl.next_page_token(response) == expected
+
+
+def test_products_response_is_decoded_once(mocker, requests_mock):
+    api_response = {
+        "data": {"products": {"nodes": [{"id": "gid://shopify/Product/1"}], "pageInfo": {"hasNextPage": False, "endCursor": None}}},
+        "extensions": {"cost": {"throttleStatus": {"maximumAvailable": 2000.0, "currentlyAvailable": 2000, "restoreRate": 100.0}}},
+    }
+    requests_mock.post("https://test_shop.myshopify.com/admin/api/2023-07/graphql.json", json=api_response)
+    response = requests.post("https://test_shop.myshopify.com/admin/api/2023-07/graphql.json")
+    loads = mocker.spy(orjson, "loads")
+
+    # the rate limiter, `parse_response` and `next_page_token` are reading the same page
+    assert limiter.get_graphql_api_wait_time(response) == limiter.on_very_low_load
+    assert get_response_json(response)["data"]["products"]["nodes"] == [{"id": "gid://shopify/Product/1"}]
+    assert ProductsGraphQl.next_page_token(response) is None
+    assert loads.call_count == 1
+
+
+def test_response_json_with_lone_surrogate():
+    response = requests.Response()
+    response._content = b'{"data": {"products": {"nodes": [{"title": "\\ud800"}]}}}'
+    assert get_response_json(response)["data"]["products"]["nodes"] == [{"title": "\ud800"}]
@@ -7,6 +7,7 @@ import math
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 from airbyte_cdk.utils import AirbyteTracedException
 from source_shopify.auth import ShopifyAuthenticator
 from source_shopify.source import ConnectionCheckTest, SourceShopify
@@ -238,6 +239,16 @@ def test_get_updated_state(config, last_record, current_state, expected) -> None
     assert stream.get_updated_state(current_state, last_record) == expected
 
 
+def test_streams_share_source_session(config) -> None:
+    config["session"] = requests.Session()
+    assert Customers(config)._http_client._session is config["session"]
+    assert Locations(config)._http_client._session is config["session"]
+
+
+def test_streams_without_source_session(config) -> None:
+    assert Customers(config)._http_client._session is not Locations(config)._http_client._session
+
+
 def test_parse_response_with_bad_json(config, response_with_bad_json) -> None:
     stream = Customers(config)
     assert list(stream.parse_response(response_with_bad_json)) == [{}]